@@ -1,6 +1,7 @@
 """App utilities for Super Mario Bros 2 gymnasium environment."""
 
 import os
+from functools import lru_cache
 from typing import (
     Optional,
     Union,
@@ -15,6 +16,63 @@ from .info_display import (
     get_required_info_height,
 )
 
+# Reverse lookups for validating user-supplied names
+_CHARACTER_NAME_TO_ID = {v.lower(): k for k, v in CHARACTER_NAMES.items()}
+_LEVEL_NAME_TO_ID = {v: k for k, v in LEVEL_NAMES.items()}
+
+# Built-in ROM and save states ship inside the package, so their paths never change
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_BUILTIN_ROM_PATH = os.path.join(_PACKAGE_DIR, '_nes', 'prg0', 'super_mario_bros_2_prg0.nes')
+
+
+@lru_cache(maxsize=None)
+def _builtin_save_state_path(character_name: str, level: str) -> Optional[str]:
+    """Get the bundled save state for a character/level, or None if not shipped."""
+    save_path = os.path.join(_PACKAGE_DIR, '_nes', 'prg0', 'saves', character_name, f'{level}.sav')
+    return save_path if os.path.exists(save_path) else None
+
+
+def _character_name_to_id(name: str) -> int:
+    """Convert character name to ID."""
+    name_lower = name.lower()
+
+    if name_lower not in _CHARACTER_NAME_TO_ID:
+        valid_names = list(_CHARACTER_NAME_TO_ID.keys())
+        raise ValueError(f"Invalid character '{name}'. Valid: {', '.join(valid_names)}")
+
+    return _CHARACTER_NAME_TO_ID[name_lower]
+
+
+def _validate_level(level: str) -> int:
+    """Validate and convert level string to level ID."""
+    if level not in _LEVEL_NAME_TO_ID:
+        valid_levels = sorted(LEVEL_NAMES.values())
+        raise ValueError(f"Invalid level '{level}'. Valid: {', '.join(valid_levels)}")
+
+    return _LEVEL_NAME_TO_ID[level]
+
+
+@lru_cache(maxsize=64)
+def _resolve_character_and_level(character: Union[str, int], level: str) -> tuple[int, int]:
+    """Resolve a character/level pair to their IDs.
+
+    Vectorized setups build many identical configs, so the result is memoized. Invalid
+    inputs raise ValueError, which lru_cache never stores.
+
+    Args:
+        character: Character name or ID
+        level: Level string (e.g., "1-1")
+
+    Returns:
+        Tuple of (character_id, level_id)
+    """
+    if isinstance(character, str):
+        character_id = _character_name_to_id(character)
+    else:
+        character_id = character
+
+    return character_id, _validate_level(level)
+
 
 class InitConfig:
     """Configuration for initializing SMB2 environment.
@@ -54,35 +112,7 @@ class InitConfig:
         self.rom_path = rom_path
         self.save_state_path = save_state_path
 
-        # Convert character name to ID if needed
-        if isinstance(self.character, str):
-            self.character_id = self._character_name_to_id(self.character)
-        else:
-            self.character_id = self.character
-
-        # Validate level
-        self.level_id = self._validate_level(self.level)
-
-    def _character_name_to_id(self, name: str) -> int:
-        """Convert character name to ID."""
-        char_map = {v.lower(): k for k, v in CHARACTER_NAMES.items()}
-        name_lower = name.lower()
-
-        if name_lower not in char_map:
-            valid_names = list(char_map.keys())
-            raise ValueError(f"Invalid character '{name}'. Valid: {', '.join(valid_names)}")
-
-        return char_map[name_lower]
-
-    def _validate_level(self, level: str) -> int:
-        """Validate and convert level string to level ID."""
-        level_str_to_id = {v: k for k, v in LEVEL_NAMES.items()}
-
-        if level not in level_str_to_id:
-            valid_levels = sorted(LEVEL_NAMES.values())
-            raise ValueError(f"Invalid level '{level}'. Valid: {', '.join(valid_levels)}")
-
-        return level_str_to_id[level]
+        self.character_id, self.level_id = _resolve_character_and_level(self.character, self.level)
 
     def get_rom_path(self) -> str:
         """Get ROM file path."""
@@ -92,9 +122,7 @@ class InitConfig:
             return os.path.abspath(self.rom_path)
         else:
             # Use built-in ROM
-            base_dir = os.path.dirname(os.path.dirname(__file__))
-            rom_path = os.path.join(base_dir, '_nes', 'prg0', 'super_mario_bros_2_prg0.nes')
-            return os.path.abspath(rom_path)
+            return _BUILTIN_ROM_PATH
 
     def get_save_state_path(self) -> Optional[str]:
         """Get save state file path."""
@@ -104,12 +132,8 @@ class InitConfig:
             return os.path.abspath(self.save_state_path)
         elif not self.rom_path:
             # Use built-in save state for level/character mode
-            base_dir = os.path.dirname(os.path.dirname(__file__))
             character_name = CHARACTER_NAMES[self.character_id].lower()
-            save_path = os.path.join(
-                base_dir, '_nes', 'prg0', 'saves', character_name, f'{self.level}.sav'
-            )
-            return os.path.abspath(save_path) if os.path.exists(save_path) else None
+            return _builtin_save_state_path(character_name, self.level)
         else:
             return None
 
@@ -1,10 +1,14 @@
 """Info display module for Super Mario Bros 2."""
 
+from functools import lru_cache
 from typing import Any
 
 import pygame
 
-from ..constants import CHARACTER_NAMES
+from ..constants import (
+    CHARACTER_NAMES_TUPLE,
+    Enemy,
+)
 from ..constants.object_ids import (
     CollisionFlags,
     EnemyId,
@@ -14,6 +18,50 @@ from ..constants.object_ids import (
 )
 
 
+@lru_cache(maxsize=512)
+def _render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: tuple[int, int, int],
+) -> pygame.Surface:
+    """Render text once per (font, text, colour) and reuse the surface on later frames."""
+    return font.render(text, True, color)
+
+
+# Enemy table column widths as multiples of a tenth of the table width
+# Slot(small), Name(big), HP, (X,Y), (RelX,RelY), Vel(X,Y), State, Timer, Flags(bigger), Collision(bigger)
+_ENEMY_COLUMN_WEIGHTS = (
+    0.5,  # Slot
+    1.5,  # Name
+    0.3,  # HP
+    0.9,  # (X, Y)
+    0.9,  # (RelX, RelY)
+    0.9,  # Vel (X, Y)
+    0.8,  # State - VISIBLE, INVISIBLE, DEAD
+    0.5,  # Timer
+    1.4,  # Flags
+    1.4,  # Collision
+)
+
+# Raw RAM value -> enum member name, so formatting never constructs an enum
+_ENEMY_ID_NAMES = {member.value: member.name for member in EnemyId}
+_ENEMY_STATE_NAMES = {member.value: member.name for member in EnemyState}
+_PLAYER_STATE_NAMES = {member.value: member.name for member in PlayerState}
+
+
+@lru_cache(maxsize=8)
+def _enemy_column_offsets(screen_width: int, padding: int) -> tuple[int, ...]:
+    """Get the x position of each enemy table column for a screen width."""
+    base_width = (screen_width - 2 * padding) // 10
+
+    offsets = []
+    x_offset = padding
+    for weight in _ENEMY_COLUMN_WEIGHTS:
+        offsets.append(x_offset)
+        x_offset += int(base_width * weight)
+    return tuple(offsets)
+
+
 def get_required_info_height(scale: int = 1) -> int:
     """Get the minimum height needed for the info display."""
     # Base: 18 info rows + 9 enemy slots = 27 rows total
@@ -32,13 +80,13 @@ def format_enemy_name(enemy_id: int | None) -> str:
     """
     if enemy_id is None:
         return ""
-    try:
-        enemy_name = EnemyId(enemy_id).name
-        return enemy_name
-    except ValueError:
+    enemy_name = _ENEMY_ID_NAMES.get(enemy_id)
+    if enemy_name is None:
         return f"UNKNOWN_{enemy_id:02X}"
+    return enemy_name
 
 
+@lru_cache(maxsize=256)
 def format_collision_flags(collision: int | None) -> str:
     """Format collision flags as names.
 
@@ -59,6 +107,7 @@ def format_collision_flags(collision: int | None) -> str:
     return ",".join(flags) if flags else ""
 
 
+@lru_cache(maxsize=256)
 def format_sprite_flags(sprite_flags: int | None) -> str:
     """Format sprite flags as names.
 
@@ -91,10 +140,28 @@ def format_enemy_state(state: int, has_enemy: bool) -> str:
     """
     if not has_enemy:
         return ""
-    try:
-        return EnemyState(state).name
-    except ValueError:
+    state_name = _ENEMY_STATE_NAMES.get(state)
+    if state_name is None:
         return str(state)
+    return state_name
+
+
+def format_enemy_relative(enemy: Enemy, player_x: int, player_y: int) -> str:
+    """Format enemy position relative to the player.
+
+    Args:
+        enemy: Enemy slot data
+        player_x: Player global X position
+        player_y: Player global Y position
+
+    Returns:
+        String like "(-12, 30)" or "" if the enemy has no position
+    """
+    rel_x = enemy.relative_x(player_x)
+    rel_y = enemy.relative_y(player_y)
+    if rel_x is None or rel_y is None:
+        return ""
+    return f"({rel_x}, {rel_y})"
 
 
 def create_info_panel(
@@ -119,7 +186,7 @@ def create_info_panel(
     info_height = get_required_info_height()
 
     # Draw background
-    pygame.draw.rect(screen, (30, 30, 30), (0, game_height, screen_width, info_height))
+    screen.fill((30, 30, 30), (0, game_height, screen_width, info_height))
 
     # Table configuration
     padding = 10
@@ -135,12 +202,26 @@ def create_info_panel(
     x_start = padding
     y_start = game_height + padding
 
+    # Separator lines run from x_start to screen_width - padding inclusive
+    separator_width = screen_width - padding - x_start + 1
+
     # Extract accessor objects
     pc = info['pc']
     pos = info['pos']
     game = info['game']
     enemies = info['enemies']
 
+    # Player global position is used by several rows, so resolve it once
+    player_x = pos.x_global
+    player_y = pos.y_global
+
+    # Character IDs are 0-3, so index the names directly
+    character = pc.character
+    if 0 <= character < len(CHARACTER_NAMES_TUPLE):
+        character_name = CHARACTER_NAMES_TUPLE[character]
+    else:
+        character_name = 'Unknown'
+
     # Create all data rows organized into sections
     data = [
         # POSITION SECTION
@@ -149,7 +230,7 @@ def create_info_panel(
         ("Area", f"{pos.area}-{pos.sub_area}", "Subspace Status", str(pc.subspace_status)),
         (
             "Local (X, Y)", f"({pos.x_local}, {pos.y_local})", "Global (X, Y)",
-            f"({pos.x_global}, {pos.y_global})"
+            f"({player_x}, {player_y})"
         ),
         (
             "Page (X, Y)", f"({pos.x_page}, {pos.y_page})", "Current/Total",
@@ -159,7 +240,7 @@ def create_info_panel(
 
         # PLAYER SECTION
         ("PLAYER", "", "", ""),
-        ("Character", CHARACTER_NAMES.get(pc.character, 'Unknown'), "Lives", str(pc.lives)),
+        ("Character", character_name, "Lives", str(pc.lives)),
         ("Hearts", f"{pc.hearts}/4", "Player Speed", str(pc.speed)),
         ("Cherries", str(pc.cherries), "Coins", str(pc.coins)),
         ("Holding Item", "Yes" if pc.holding_item else "No", "Item Pulled", str(pc.item_pulled)),
@@ -175,8 +256,7 @@ def create_info_panel(
         ),
         (
             "Level Completed", "Yes" if pc.level_completed else "No", "Player State",
-            PlayerState(pc.state).name
-            if pc.state in [ps.value for ps in PlayerState] else str(pc.state)
+            _PLAYER_STATE_NAMES.get(pc.state) or str(pc.state)
         ),
         (
             "Mario Levels", str(pc.levels_finished['mario']), "Luigi Levels",
@@ -200,9 +280,7 @@ def create_info_panel(
                 f"{e.slot_number}", format_enemy_name(e.object_type),
                 str(e.health) if e.health is not None else "", f"({e.x_position}, {e.y_position})"
                 if e.x_position is not None and e.y_position is not None else "",
-                f"({e.relative_x(pos.x_global)}, {e.relative_y(pos.y_global)})"
-                if e.relative_x(pos.x_global) is not None and e.relative_y(pos.y_global) is not None
-                else "", f"({e.x_velocity}, {e.y_velocity})"
+                format_enemy_relative(e, player_x, player_y), f"({e.x_velocity}, {e.y_velocity})"
                 if e.x_velocity is not None and e.y_velocity is not None else "",
                 format_enemy_state(e.state, e.object_type is not None),
                 str(e.object_timer) if e.object_timer is not None else "",
@@ -211,8 +289,9 @@ def create_info_panel(
         ],
     ]
 
-    # Draw the table
+    # Draw the table, queueing text so it can be blitted in batches between separator lines
     current_y = y_start
+    text_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
     for i, row in enumerate(data):
         # Check if this is a section header (4-column row with empty strings in cols 2-4)
@@ -220,64 +299,47 @@ def create_info_panel(
 
         # Draw line before section header
         if is_section_header:
-            pygame.draw.line(
-                screen, (60, 60, 60), (x_start, current_y), (screen_width - padding, current_y), 1
-            )
+            screen.blits(text_blits, doreturn=False)
+            text_blits.clear()
+            screen.fill((60, 60, 60), (x_start, current_y, separator_width, 1))
             current_y += 6
 
         # Check if this is a multi-column enemy table row (10 columns)
         if len(row) == 10:
-            # Enemy table: custom column widths
-            # Slot(small), Name(big), HP, (X,Y), (RelX,RelY), Vel(X,Y), State, Timer, Flags(bigger), Collision(bigger)
-            total_width = screen_width - 2 * padding
-            base_width = total_width // 10
-            col_widths = [
-                int(base_width * 0.5),  # Slot
-                int(base_width * 1.5),  # Name
-                int(base_width * 0.3),  # HP
-                int(base_width * 0.9),  # (X, Y)
-                int(base_width * 0.9),  # (RelX, RelY)
-                int(base_width * 0.9),  # Vel (X, Y)
-                int(base_width * 0.8),  # State - VISIBLE, INVISIBLE, DEAD
-                int(base_width * 0.5),  # Timer
-                int(base_width * 1.4),  # Flags
-                int(base_width * 1.4)  # Collision
-            ]
-
-            x_offset = x_start
-            for j, cell in enumerate(row):
-                # Use header colour for enemy table header row (index 14)
-                # POSITION (0-6 = 7 rows), PLAYER (7-13 = 7 rows), ENEMIES header (14), enemy header (15), enemies (16-24)
-                color = header_color if i == 15 else value_color
-                cell_surface = font.render(str(cell), True, color)
-                screen.blit(cell_surface, (x_offset, current_y))
-                x_offset += col_widths[j]
+            # Enemy table: columns laid out by _ENEMY_COLUMN_WEIGHTS
+            # Use header colour for enemy table header row (index 14)
+            # POSITION (0-6 = 7 rows), PLAYER (7-13 = 7 rows), ENEMIES header (14), enemy header (15), enemies (16-24)
+            color = header_color if i == 15 else value_color
+            for cell, x_offset in zip(row, _enemy_column_offsets(screen_width, padding)):
+                cell_surface = _render_text(font, str(cell), color)
+                text_blits.append((cell_surface, (x_offset, current_y)))
         elif is_section_header:
             # Section header - render in blue, centered, no colon
-            header_surface = font.render(row[0], True, header_color)
-            screen.blit(header_surface, (x_start, current_y))
+            header_surface = _render_text(font, row[0], header_color)
+            text_blits.append((header_surface, (x_start, current_y)))
         else:
             # Regular 4-column layout (label-value pairs)
-            label1_surface = font.render(row[0] + ":", True, label_color)
-            value1_surface = font.render(row[1], True, value_color)
-            screen.blit(label1_surface, (x_start, current_y))
-            screen.blit(value1_surface, (x_start + col_width, current_y))
+            label1_surface = _render_text(font, row[0] + ":", label_color)
+            value1_surface = _render_text(font, row[1], value_color)
+            text_blits.append((label1_surface, (x_start, current_y)))
+            text_blits.append((value1_surface, (x_start + col_width, current_y)))
 
             # Don't add colon to column 3 if it's empty (for headers)
             label2_text = row[2] + ":" if row[2] else ""
-            label2_surface = font.render(label2_text, True, label_color)
-            value2_surface = font.render(row[3], True, value_color)
-            screen.blit(label2_surface, (x_start + col_width * 2, current_y))
-            screen.blit(value2_surface, (x_start + col_width * 3, current_y))
+            label2_surface = _render_text(font, label2_text, label_color)
+            value2_surface = _render_text(font, row[3], value_color)
+            text_blits.append((label2_surface, (x_start + col_width * 2, current_y)))
+            text_blits.append((value2_surface, (x_start + col_width * 3, current_y)))
 
         current_y += line_height
 
         # Draw line after section headers and enemy table header (but not between enemy slots)
         if is_section_header or i == 15:  # After section headers or enemy table header only
-            pygame.draw.line(
-                screen, (60, 60, 60), (x_start, current_y + 2),
-                (screen_width - padding, current_y + 2), 1
-            )
+            screen.blits(text_blits, doreturn=False)
+            text_blits.clear()
+            screen.fill((60, 60, 60), (x_start, current_y + 2, separator_width, 1))
             current_y += 6
 
+    screen.blits(text_blits, doreturn=False)
+
     return info_height
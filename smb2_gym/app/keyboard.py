@@ -2,8 +2,6 @@
 
 import pygame
 
-from ..actions import actions_to_buttons
-
 KEYBOARD_MAPPING = {
     pygame.K_RIGHT: 'right',
     pygame.K_LEFT: 'left',
@@ -16,46 +14,73 @@ KEYBOARD_MAPPING = {
 }
 
 
-def get_action_from_keyboard() -> int:
-    """Get game action from current keyboard state.
-
-    Returns:
-        Action index (0-11)
-    """
-    keys = pygame.key.get_pressed()
-    keys_pressed = []
-
-    # Check keyboard mappings
-    for key, action in KEYBOARD_MAPPING.items():
-        if keys[key]:
-            if action not in keys_pressed:
-                keys_pressed.append(action)
-
-    # Convert to button states
-    buttons = actions_to_buttons(keys_pressed)
-
-    # Map button combinations to simple actions
-    if buttons[5] and buttons[0]:  # DOWN + A (super jump if charged)
+def _buttons_to_simple_action(
+    down: bool,
+    left: bool,
+    right: bool,
+    up: bool,
+    a: bool,
+    b: bool,
+) -> int:
+    """Map a button combination to a simple action index, in priority order."""
+    if down and a:  # DOWN + A (super jump if charged)
         return 11
-    elif buttons[6] and buttons[0]:  # LEFT + A
+    elif left and a:  # LEFT + A
         return 7
-    elif buttons[7] and buttons[0]:  # RIGHT + A
+    elif right and a:  # RIGHT + A
         return 6
-    elif buttons[6] and buttons[1]:  # LEFT + B
+    elif left and b:  # LEFT + B
         return 9
-    elif buttons[7] and buttons[1]:  # RIGHT + B
+    elif right and b:  # RIGHT + B
         return 8
-    elif buttons[5]:  # DOWN (crouch/charge)
+    elif down:  # DOWN (crouch/charge)
         return 10
-    elif buttons[6]:  # LEFT
+    elif left:  # LEFT
         return 2
-    elif buttons[7]:  # RIGHT
+    elif right:  # RIGHT
         return 1
-    elif buttons[4]:  # UP
+    elif up:  # UP
         return 3
-    elif buttons[0]:  # A
+    elif a:  # A
         return 4
-    elif buttons[1]:  # B
+    elif b:  # B
         return 5
 
     return 0  # NOOP
+
+
+# Bit of each action in the _ACTION_LUT index, in _buttons_to_simple_action argument order
+# (START and SELECT don't select a simple action)
+_ACTION_BITS = {'down': 1 << 5, 'left': 1 << 4, 'right': 1 << 3, 'up': 1 << 2, 'a': 1 << 1, 'b': 1}
+
+
+def _index_to_buttons(index: int) -> list[bool]:
+    """Unpack an _ACTION_LUT index into (down, left, right, up, a, b) button states."""
+    return [bool(index & bit) for bit in _ACTION_BITS.values()]
+
+
+# Simple action for every (DOWN, LEFT, RIGHT, UP, A, B) combination, packed MSB first
+_ACTION_LUT = tuple(_buttons_to_simple_action(*_index_to_buttons(index)) for index in range(64))
+
+# (key, index bit) for every key that feeds the simple action decoder
+_KEY_BITS = tuple(
+    (key, _ACTION_BITS[action])
+    for key, action in KEYBOARD_MAPPING.items()
+    if action in _ACTION_BITS
+)
+
+
+def get_action_from_keyboard() -> int:
+    """Get game action from current keyboard state.
+
+    Returns:
+        Action index (0-11)
+    """
+    keys = pygame.key.get_pressed()
+
+    # Pack pressed keys straight into the lookup table index
+    index = 0
+    for key, bit in _KEY_BITS:
+        if keys[key]:
+            index |= bit
+    return _ACTION_LUT[index]
@@ -1,13 +1,93 @@
 """Display and rendering functions for human play interface."""
 
+from functools import lru_cache
+
 import numpy as np
 import pygame
 
-from smb2_gym.app.info_display import create_info_panel
+from smb2_gym.app.info_display import (
+    _render_text,
+    create_info_panel,
+    get_required_info_height,
+)
 from smb2_gym.app.rendering import render_frame
-from smb2_gym.constants import TILE_COLORS, FineTileType
+from smb2_gym.constants import (
+    COLOR_LOOKUP,
+    TILE_COLORS,
+    FineTileType,
+)
 from smb2_gym.smb2_env import SuperMarioBros2Env
 
+# One-pixel-per-tile colour surfaces, reused across frames and keyed by (width, height) in tiles
+_TILE_SURFACES: dict[tuple[int, int], pygame.Surface] = {}
+
+# Rendered semantic maps with the tile types they show, keyed by (width, height, tile_size)
+_MAP_SURFACES: dict[tuple[int, int, int], tuple[np.ndarray, pygame.Surface]] = {}
+
+# Game frame surfaces, reused across frames and keyed by (width, height) in pixels
+_GAME_SURFACES: dict[tuple[int, int], pygame.Surface] = {}
+
+# Pre-rendered legend entries, keyed by the font used for the labels
+_LEGEND_SURFACES: dict[pygame.font.Font, pygame.Surface] = {}
+
+# Background colour behind everything the display does not paint itself
+_BACKGROUND_COLOR = (40, 40, 40)
+
+
+@lru_cache(maxsize=8)
+def _grid_overlay(width: int, height: int, tile_size: int) -> pygame.Surface:
+    """Build a transparent surface holding the black border of every tile in the grid."""
+    overlay = pygame.Surface((width * tile_size, height * tile_size), pygame.SRCALPHA)
+    for y in range(height):
+        overlay.fill((0, 0, 0, 255), (0, y * tile_size, overlay.get_width(), 1))
+        overlay.fill((0, 0, 0, 255), (0, (y + 1) * tile_size - 1, overlay.get_width(), 1))
+    for x in range(width):
+        overlay.fill((0, 0, 0, 255), (x * tile_size, 0, 1, overlay.get_height()))
+        overlay.fill((0, 0, 0, 255), ((x + 1) * tile_size - 1, 0, 1, overlay.get_height()))
+    return overlay
+
+
+@lru_cache(maxsize=8)
+def _player_marker(tile_size: int) -> tuple[pygame.Surface, int]:
+    """Build the player marker (white disc with a red ring) and return it with its centre offset."""
+    radius = tile_size // 3
+    center = radius + 1
+    marker = pygame.Surface((2 * center, 2 * center), pygame.SRCALPHA)
+    pygame.draw.circle(marker, (255, 255, 255), (center, center), radius)
+    pygame.draw.circle(marker, (255, 0, 0), (center, center), radius, 2)
+    return marker, center
+
+
+@lru_cache(maxsize=8)
+def _gutter_rects(
+    screen_size: tuple[int, int],
+    game_rect: tuple[int, int, int, int],
+    map_rect: tuple[int, int, int, int],
+    panel_rect: tuple[int, int, int, int],
+) -> tuple[tuple[int, int, int, int], ...]:
+    """Get the screen areas not painted over by the game, semantic map or info panel.
+
+    The game and semantic map sit side by side above the info panel, so everything else is
+    covered by thin vertical strips around them plus whatever is left below the panel.
+    """
+    screen_width, screen_height = screen_size
+    game_x, game_y, game_width, game_height = game_rect
+    map_x, map_y, map_width, map_height = map_rect
+    panel_top = panel_rect[1]
+    panel_bottom = panel_rect[1] + panel_rect[3]
+
+    rects = (
+        (0, 0, game_x, panel_top),
+        (game_x, 0, game_width, game_y),
+        (game_x, game_y + game_height, game_width, panel_top - game_y - game_height),
+        (game_x + game_width, 0, map_x - game_x - game_width, panel_top),
+        (map_x, 0, map_width, map_y),
+        (map_x, map_y + map_height, map_width, panel_top - map_y - map_height),
+        (map_x + map_width, 0, screen_width - map_x - map_width, panel_top),
+        (0, panel_bottom, screen_width, screen_height - panel_bottom),
+    )
+    return tuple(rect for rect in rects if rect[2] > 0 and rect[3] > 0)
+
 
 def draw_semantic_map(
     surface: pygame.Surface,
@@ -22,24 +102,31 @@ def draw_semantic_map(
         semantic_map: Structured array with 'fine_type', 'color_r', 'color_g', 'color_b' fields
     """
     height, width = semantic_map.shape
+    fine_types = semantic_map['fine_type']
 
-    for y in range(height):
-        for x in range(width):
+    # Colours are a pure function of tile type, so an unchanged type grid reuses the last render
+    cached = _MAP_SURFACES.get((width, height, tile_size))
+    if cached is not None and cached[1].get_bitsize() == surface.get_bitsize():
+        cached_types, map_surface = cached
+        if np.array_equal(cached_types, fine_types):
+            surface.blit(map_surface, (x_offset, y_offset))
+            return
+    else:
+        map_surface = pygame.Surface((width * tile_size, height * tile_size), 0, surface)
 
-            # Get colours
-            color = (
-                int(semantic_map[y, x]['color_r']),
-                int(semantic_map[y, x]['color_g']),
-                int(semantic_map[y, x]['color_b']),
-            )
+    # Colour one pixel per tile, then let SDL upscale it to tile_size pixels in a single pass
+    tile_surface = _TILE_SURFACES.get((width, height))
+    if tile_surface is None or tile_surface.get_bitsize() != surface.get_bitsize():
+        tile_surface = pygame.Surface((width, height), 0, surface)
+        _TILE_SURFACES[(width, height)] = tile_surface
+    pygame.surfarray.blit_array(tile_surface, COLOR_LOOKUP[fine_types].swapaxes(0, 1))
+    pygame.transform.scale(tile_surface, map_surface.get_size(), map_surface)
 
-            # Calculate position
-            screen_y = y * tile_size + y_offset
-            screen_x = x * tile_size + x_offset
+    # Black border around each tile
+    map_surface.blit(_grid_overlay(width, height, tile_size), (0, 0))
 
-            rect = pygame.Rect(screen_x, screen_y, tile_size, tile_size)
-            pygame.draw.rect(surface, color, rect)
-            pygame.draw.rect(surface, (0, 0, 0), rect, 1)  # Black border
+    _MAP_SURFACES[(width, height, tile_size)] = (fine_types.copy(), map_surface)
+    surface.blit(map_surface, (x_offset, y_offset))
 
 
 def draw_player_position(
@@ -53,11 +140,50 @@ def draw_player_position(
     # Get player collision tiles from the environment
     player_tiles = env.get_player_collision_tiles()
 
-    for tile_x, tile_y in player_tiles:
-        screen_x = tile_x * tile_size + x_offset + tile_size // 2
-        screen_y = tile_y * tile_size + y_offset + tile_size // 2
-        pygame.draw.circle(surface, (255, 255, 255), (screen_x, screen_y), tile_size // 3)
-        pygame.draw.circle(surface, (255, 0, 0), (screen_x, screen_y), tile_size // 3, 2)
+    # Marker top-left corner for a tile: tile centre minus the marker's own centre
+    marker, marker_center = _player_marker(tile_size)
+    x_start = x_offset + tile_size // 2 - marker_center
+    y_start = y_offset + tile_size // 2 - marker_center
+    surface.blits(
+        [
+            (marker, (tile_x * tile_size + x_start, tile_y * tile_size + y_start))
+            for tile_x, tile_y in player_tiles
+        ],
+        doreturn=False,
+    )
+
+
+def _render_legend(font: pygame.font.Font, reference: pygame.Surface) -> pygame.Surface:
+    """Render the colour box and label of every semantic tile type onto one opaque surface."""
+    tile_types = [tile_type for tile_type in FineTileType if tile_type != FineTileType.EMPTY]
+    labels = [_render_text(font, tile_type.name, (255, 255, 255)) for tile_type in tile_types]
+
+    width = 20 + max(label.get_width() for label in labels)
+    height = 20 * (len(tile_types) - 1) + max(16, max(label.get_height() for label in labels))
+    legend = pygame.Surface((width, height), 0, reference)
+    legend.fill(_BACKGROUND_COLOR)
+
+    for index, (tile_type, label) in enumerate(zip(tile_types, labels)):
+        y_pos = index * 20
+        color = TILE_COLORS.get(tile_type, (128, 128, 128))
+
+        # Draw colour box with a one pixel black border
+        legend.fill((0, 0, 0), (0, y_pos, 16, 16))
+        legend.fill(color, (1, y_pos + 1, 14, 14))
+
+        # Label using enum name
+        legend.blit(label, (20, y_pos))
+
+    return legend
+
+
+def _legend_surface(font: pygame.font.Font, surface: pygame.Surface) -> pygame.Surface:
+    """Get the legend for a font, rendering it on first use since it never changes."""
+    legend = _LEGEND_SURFACES.get(font)
+    if legend is None or legend.get_bitsize() != surface.get_bitsize():
+        legend = _render_legend(font, surface)
+        _LEGEND_SURFACES[font] = legend
+    return legend
 
 
 def draw_legend(
@@ -67,24 +193,7 @@ def draw_legend(
     y_offset: int,
 ) -> None:
     """Draw a legend for semantic tile types."""
-    y_pos = y_offset
-
-    for tile_type in FineTileType:
-        if tile_type == FineTileType.EMPTY:
-            continue
-
-        color = TILE_COLORS.get(tile_type, (128, 128, 128))
-
-        # Draw colour box
-        rect = pygame.Rect(x_offset, y_pos, 16, 16)
-        pygame.draw.rect(surface, color, rect)
-        pygame.draw.rect(surface, (0, 0, 0), rect, 1)
-
-        # Draw text using enum name
-        text = font.render(tile_type.name, True, (255, 255, 255))
-        surface.blit(text, (x_offset + 20, y_pos))
-
-        y_pos += 20
+    surface.blit(_legend_surface(font, surface), (x_offset, y_offset))
 
 
 def render_all(
@@ -101,39 +210,52 @@ def render_all(
     paused: bool,
 ) -> None:
     """Render all game elements to screen."""
-    # Clear screen
-    screen.fill((40, 40, 40))
-
-    # Render game on the left side
-    game_surface = pygame.Surface((game_width, game_height))
-    render_frame(game_surface, obs, game_width, game_height)
-    screen.blit(game_surface, (10, 10))
-
-    # Get and render semantic map on the right side
     semantic_map = env.semantic_map
     map_x_offset = game_width + 30
     map_y_offset = 10
     tile_size = 20
+    map_height, map_width = semantic_map.shape
+
+    # Clear only the background; the game, semantic map and info panel paint their own areas
+    for rect in _gutter_rects(
+        screen.get_size(),
+        (10, 10, game_width, game_height),
+        (map_x_offset, map_y_offset, map_width * tile_size, map_height * tile_size),
+        (0, total_height, total_width, get_required_info_height()),
+    ):
+        screen.fill(_BACKGROUND_COLOR, rect)
 
+    # Render game on the left side
+    game_surface = _GAME_SURFACES.get((game_width, game_height))
+    if game_surface is None or game_surface.get_bitsize() != screen.get_bitsize():
+        # Match the screen's pixel format so the blit below is a plain copy
+        game_surface = pygame.Surface((game_width, game_height), 0, screen)
+        _GAME_SURFACES[(game_width, game_height)] = game_surface
+    render_frame(game_surface, obs, game_width, game_height)
+    screen.blit(game_surface, (10, 10))
+
+    # Render semantic map on the right side
     draw_semantic_map(screen, semantic_map, map_x_offset, map_y_offset, tile_size)
     draw_player_position(screen, env, map_x_offset, map_y_offset, tile_size)
 
-    # Draw semantic map title
-    title_text = font.render("Semantic Map", True, (255, 255, 255))
-    screen.blit(title_text, (map_x_offset, map_y_offset - 30))
-
-    # Draw legend
+    # Semantic map title, legend and pause indicator don't overlap anything drawn after them,
+    # so they are blitted together once the info panel is done
     legend_x = map_x_offset + (16 * tile_size) + 10
     legend_y = map_y_offset
-    legend_title = small_font.render("Legend:", True, (255, 255, 255))
-    screen.blit(legend_title, (legend_x, legend_y))
-    draw_legend(screen, small_font, legend_x, legend_y + 20)
+    overlays = [
+        (_render_text(font, "Semantic Map", (255, 255, 255)), (map_x_offset, map_y_offset - 30)),
+        (_render_text(small_font, "Legend:", (255, 255, 255)), (legend_x, legend_y)),
+        (_legend_surface(small_font, screen), (legend_x, legend_y + 20)),
+    ]
 
     # Draw game info panel at bottom
     create_info_panel(screen, info, font, total_height, total_width)
 
     # Draw pause indicator
     if paused:
-        pause_text = font.render("PAUSED", True, (255, 255, 0))
-        text_rect = pause_text.get_rect(center=(total_width // 2, total_height // 2))
-        screen.blit(pause_text, text_rect)
+        pause_text = _render_text(font, "PAUSED", (255, 255, 0))
+        overlays.append(
+            (pause_text, pause_text.get_rect(center=(total_width // 2, total_height // 2)).topleft)
+        )
+
+    screen.blits(overlays, doreturn=False)
@@ -3,6 +3,12 @@
 import numpy as np
 import pygame
 
+# Native-resolution frame surfaces, reused across frames and keyed by target pixel format
+_FRAME_SURFACES: dict[tuple[int, tuple[int, int, int, int]], pygame.Surface] = {}
+
+# Palette mapping each grayscale byte to the matching grey
+_GRAYSCALE_PALETTE = [(i, i, i) for i in range(256)]
+
 
 def render_frame(screen: pygame.Surface, obs: np.ndarray, width: int, height: int) -> None:
     """Render a game frame to a pygame surface.
@@ -14,16 +20,27 @@ def render_frame(screen: pygame.Surface, obs: np.ndarray, width: int, height: in
         height: Target height for scaling
     """
     screen.fill((0, 0, 0))  # Clear screen
-    frame = pygame.Surface((256, 240), depth=24)  # Draw frame
 
-    # Handle both RGB and grayscale observations
+    # Row-major frames are already packed pixels, so wrap them without transposing or copying
     if obs.ndim == 2:  # Grayscale: shape (240, 256)
-        # Convert grayscale to RGB for pygame display
-        obs_rgb = np.stack([obs, obs, obs], axis=-1)  # (240, 256, 3)
-        frame_data = np.transpose(obs_rgb, (1, 0, 2))  # (256, 240, 3)
+        # Show each byte as an 8-bit palette index into a grey ramp instead of stacking to RGB
+        frame_buffer = pygame.image.frombuffer(np.ascontiguousarray(obs).data, (256, 240), 'P')
+        frame_buffer.set_palette(_GRAYSCALE_PALETTE)
     else:  # RGB: shape (240, 256, 3)
-        frame_data = np.transpose(obs, (1, 0, 2))  # (256, 240, 3)
+        frame_buffer = pygame.image.frombuffer(np.ascontiguousarray(obs).data, (256, 240), 'RGB')
+
+    # At native size there is nothing to scale, so blit straight to the target
+    if (width, height) == (256, 240):
+        screen.blit(frame_buffer, (0, 0))
+        return
+
+    # Match the target's pixel format so the frame can be scaled straight into it
+    # Scaling copies raw pixels, so both bit depth and channel masks have to match
+    pixel_format = (screen.get_bitsize(), screen.get_masks())
+    frame = _FRAME_SURFACES.get(pixel_format)
+    if frame is None:
+        frame = pygame.Surface((256, 240), 0, screen)
+        _FRAME_SURFACES[pixel_format] = frame
 
-    pygame.surfarray.blit_array(frame, frame_data)
-    frame = pygame.transform.scale(frame, (width, height))
-    screen.blit(frame, (0, 0))
\ No newline at end of file
+    frame.blit(frame_buffer, (0, 0))
+    pygame.transform.scale(frame, (width, height), screen.subsurface((0, 0, width, height)))
@@ -33,6 +33,7 @@ from .semantic import (
     SEMANTIC_TILE_DTYPE,
     TILE_COLORS,
     TILE_ID_MAPPING,
+    TILE_TYPE_LOOKUP,
     CoarseTileType,
     FineTileType,
 )
@@ -56,4 +57,5 @@ __all__ = [
     'TILE_ID_MAPPING',
     'COARSE_LOOKUP',
     'COLOR_LOOKUP',
+    'TILE_TYPE_LOOKUP',
 ]
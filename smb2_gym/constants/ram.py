@@ -12,9 +12,14 @@ https://github.com/Xkeeper0/smb2/blob/master/src/ram.asm
 NOTE: Some fields in these classes do not directly align with the above references
 """
 
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    fields,
+)
 from enum import IntEnum
 
+import numpy as np
+
 # ------------------------------------------------------------------------------
 # ---- Main RAM Properties -----------------------------------------------------
 # ------------------------------------------------------------------------------
@@ -121,15 +126,17 @@ class Enemy:
 
     def relative_x(self, player_global_x: int) -> int | None:
         """Get X position relative to player."""
-        if self.global_x is None:
+        global_x = self.global_x
+        if global_x is None:
             return None
-        return player_global_x - self.global_x
+        return player_global_x - global_x
 
     def relative_y(self, player_global_y: int) -> int | None:
         """Get Y position relative to player."""
-        if self.global_y is None:
+        global_y = self.global_y
+        if global_y is None:
             return None
-        return player_global_y - self.global_y
+        return player_global_y - global_y
 
 
 @dataclass
@@ -211,6 +218,12 @@ ENEMY_SLOTS = [ \
     EnemySlot(slot_number=8, x_position=0x0031, y_position=0x003B, x_page=0x001D, y_page=0x0027, object_type=0x0098, health=0x046D, state=0x0059, x_velocity=0x0045, y_velocity=0x004F, direction=0x0077, collision=0x0063, object_timer=0x0086, sprite_flags=0x046E), # NOTE: ?? timer 8, shares sprite_flags with slot 0
               ]
 
+# The same addresses as a (slot, field) array for batched reads, columns in EnemySlot field order
+ENEMY_SLOT_FIELDS = tuple(field.name for field in fields(EnemySlot) if field.name != 'slot_number')
+ENEMY_SLOT_ADDRESSES = np.array(
+    [[getattr(slot, name) for name in ENEMY_SLOT_FIELDS] for slot in ENEMY_SLOTS], dtype=np.uint16
+)
+
 # ------------------------------------------------------------------------------
 # ---- Display/Rendering/Controls ----------------------------------------------
 # ------------------------------------------------------------------------------
@@ -256,12 +269,16 @@ MAX_CONTINUES = 9
 MAX_LIVES = 9
 MAX_HEARTS = 4
 
+# Two's complement value of every byte, for signed RAM fields such as velocities
+SIGNED_BYTE = tuple(value - 256 if value >= 128 else value for value in range(256))
+
 # Collision flags - See CollisionFlags enum in object_ids.py for bitfield values
 # PLAYER_COLLISION at Player.COLLISION (0x005A)
 # ENEMY_COLLISION at EnemySlot.collision (0x005B-0x0063)
 
 # Character names for display
 CHARACTER_NAMES = {0: "Mario", 1: "Peach", 2: "Toad", 3: "Luigi"}
+CHARACTER_NAMES_TUPLE = tuple(CHARACTER_NAMES[i] for i in range(len(CHARACTER_NAMES)))
 
 # Level names
 LEVEL_NAMES = {
@@ -286,6 +303,7 @@ LEVEL_NAMES = {
     0x12: "7-1",
     0x13: "7-2"
 }
+LEVEL_NAMES_TUPLE = tuple(LEVEL_NAMES[i] for i in range(len(LEVEL_NAMES)))
 
 # ------------------------------------------------------------------------------
 # ---- Instances ---------------------------------------------------------------
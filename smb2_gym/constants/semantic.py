@@ -461,3 +461,9 @@ TILE_ID_MAPPING: dict[int, FineTileType] = { \
     BackgroundTile.UNUSED_FE: FineTileType.EMPTY,
     BackgroundTile.UNUSED_FF: FineTileType.EMPTY,
    }
+
+# Raw tile ID -> FineTileType for all 256 IDs (IDs missing from TILE_ID_MAPPING stay EMPTY)
+TILE_TYPE_LOOKUP = np.full(256, FineTileType.EMPTY, dtype=np.uint8)
+for tile_id, fine_type in TILE_ID_MAPPING.items():
+    TILE_TYPE_LOOKUP[tile_id] = fine_type
+TILE_TYPE_LOOKUP.flags.writeable = False
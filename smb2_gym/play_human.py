@@ -30,40 +30,44 @@ def _handle_events(
     env: SuperMarioBros2Env,
     paused: bool,
     game_over: bool,
-) -> tuple[bool, bool, bool]:
+) -> tuple[bool, bool, bool, bool]:
     """Handle pygame events.
 
     Returns:
-        Tuple of (running, paused, game_over)
+        Tuple of (running, paused, game_over, state_changed)
     """
     running = True
+    state_changed = False
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
+            key = event.key
+            if key == pygame.K_ESCAPE:
                 running = False
-            elif event.key == pygame.K_p:
+            elif key == pygame.K_p:
                 paused = not paused
-            elif event.key == pygame.K_r:
+            elif key == pygame.K_r:
                 env.reset()
                 game_over = False
+                state_changed = True
                 print("Game reset!")
-            elif event.key == pygame.K_F5:
+            elif key == pygame.K_F5:
                 try:
                     env.save_state(0)
                     print("State saved to save_state_0.sav")
                 except Exception as e:
                     print(f"Failed to save state: {e}")
-            elif event.key == pygame.K_F9:
+            elif key == pygame.K_F9:
                 try:
                     env.load_state(0)
+                    state_changed = True
                     print("State loaded from save_state_0.sav")
                 except Exception as e:
                     print(f"Failed to load state: {e}")
 
-    return running, paused, game_over
+    return running, paused, game_over, state_changed
 
 
 def _setup_pygame(
@@ -91,6 +95,10 @@ def _setup_pygame(
     screen = pygame.display.set_mode((total_width, total_height + info_height))
     pygame.display.set_caption(WINDOW_CAPTION)
 
+    # Only quit and key presses are handled, so keep mouse motion etc. off the event queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
     # Create fonts
     font_size = FONT_SIZE_BASE * scale // 2
     font = pygame.font.Font(None, font_size)
@@ -162,13 +170,24 @@ def play_human(
     print("    F5: Save state (creates save_state_0.sav)")
     print("    F9: Load state (loads save_state_0.sav)")
 
+    # Bind per-frame callables once rather than resolving attributes every iteration
+    env_step = env.step
+    to_action = np.int64
+    flip_display = pygame.display.flip
+    tick = clock.tick
+
     game_over = False
+    needs_redraw = True
     while running:
-        running, paused, game_over = _handle_events(env, paused, game_over)
+        prev_status = (paused, game_over)
+        running, paused, game_over, state_changed = _handle_events(env, paused, game_over)
+        if state_changed or (paused, game_over) != prev_status:
+            needs_redraw = True
 
         if not paused and not game_over:
             action = get_action_from_keyboard()
-            obs, reward, terminated, truncated, info = env.step(np.int64(action))
+            obs, reward, terminated, truncated, info = env_step(to_action(action))
+            needs_redraw = True
 
             if terminated or truncated:
                 if info.get('level_completed'):
@@ -177,23 +196,26 @@ def play_human(
                     print("Game Over! Press R (in game window) to reset or ESC to quit.")
                     game_over = True
 
-        render_all(
-            screen,
-            obs,
-            env,
-            info,
-            game_width,
-            game_height,
-            total_width,
-            total_height,
-            font,
-            small_font,
-            paused,
-        )
+        # While paused or game over the emulator doesn't advance, so the last frame is reused
+        if needs_redraw:
+            render_all(
+                screen,
+                obs,
+                env,
+                info,
+                game_width,
+                game_height,
+                total_width,
+                total_height,
+                font,
+                small_font,
+                paused,
+            )
+            needs_redraw = False
 
         # Update display
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS for human play
+        flip_display()
+        tick(60)  # 60 FPS for human play
 
     env.close()
     pygame.quit()
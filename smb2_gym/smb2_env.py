@@ -163,15 +163,19 @@ class SuperMarioBros2Env(
             )
 
         # Define action space based on action_type
+        # Button states per action are converted once here and passed to the emulator as-is
         if self.action_type == "all":
             self.action_space = spaces.Discrete(256)
             self._action_meanings = get_action_meanings()
+            self._action_buttons = tuple(action_to_buttons(a).tolist() for a in range(256))
         elif self.action_type == "complex":
             self.action_space = spaces.Discrete(len(COMPLEX_ACTIONS))
             self._action_meanings = COMPLEX_ACTIONS
+            self._action_buttons = tuple(actions_to_buttons(a).tolist() for a in COMPLEX_ACTIONS)
         elif self.action_type == "simple":
             self.action_space = spaces.Discrete(len(SIMPLE_ACTIONS))
             self._action_meanings = SIMPLE_ACTIONS
+            self._action_buttons = tuple(actions_to_buttons(a).tolist() for a in SIMPLE_ACTIONS)
 
     def _init_state_tracking(self) -> None:
         """Initialize state tracking variables."""
@@ -184,6 +188,7 @@ class SuperMarioBros2Env(
         self._previous_y_global: Optional[int] = None  # Track y position for transition detection
         self._transition_frame_count: int = 0  # Count frames since transition detected
         self._last_obs: Optional[np.ndarray] = None  # Track last observation for rendering
+        self._frame_cache: dict[str, Any] = {}  # Per-frame derived state, cleared on changes
 
     def _init_rendering(self) -> None:
         """Initialize pygame rendering when first needed."""
@@ -238,6 +243,7 @@ class SuperMarioBros2Env(
 
         # Reset NES first
         self._nes.reset()
+        self._frame_cache.clear()
         self._done = False
         self._episode_steps = 0
         self._transition_frame_count = 0
@@ -271,13 +277,14 @@ class SuperMarioBros2Env(
 
         # Get one frame after reset/loading save state
         obs, _, _, _, _ = self._nes.step([False] * 8, render=True)
+        self._frame_cache.clear()
         self._last_obs = obs
 
         info = self.info
 
         # Initialize tracking for detecting life loss and level completion
         self._previous_lives = self.lives
-        self._previous_levels_finished = self.levels_finished.copy()
+        self._previous_levels_finished = self.levels_finished
 
         # Initialize tracking with consistent global coordinates
         global_coords = self.global_coordinate_system
@@ -309,7 +316,8 @@ class SuperMarioBros2Env(
         buttons = self._validate_and_convert_action(action)
 
         # 1. Step emulator
-        obs, _, _, _, nes_info = self._nes.step(buttons.tolist(), render=True)
+        obs, _, _, _, nes_info = self._nes.step(buttons, render=True)
+        self._frame_cache.clear()
         self._episode_steps += 1
         self._last_obs = obs
 
@@ -324,7 +332,7 @@ class SuperMarioBros2Env(
 
         # Update tracking for next step
         self._previous_lives = self.lives
-        self._previous_levels_finished = self.levels_finished.copy()
+        self._previous_levels_finished = self.levels_finished
 
         # Track global coords
         global_coords = self.global_coordinate_system
@@ -574,6 +582,10 @@ class SuperMarioBros2Env(
             def door_transition_timer(self) -> int:
                 return self._env.door_transition_timer
 
+            @property
+            def timers(self) -> dict[str, int]:
+                return self._env.timers
+
             @property
             def state(self) -> int:
                 return self._env.player_state
@@ -592,7 +604,7 @@ class SuperMarioBros2Env(
 
             @property
             def level_transition(self) -> int:
-                return self._env.level_transition
+                return self._env._read_level_transition()
 
             @property
             def stats(self):
@@ -648,14 +660,14 @@ class SuperMarioBros2Env(
 
     # ---- Validators ------------------------------------------------
 
-    def _validate_and_convert_action(self, action: np.int64) -> np.ndarray:
-        """Validate and convert action to button array based on action type.
+    def _validate_and_convert_action(self, action: np.int64) -> list[bool]:
+        """Validate and convert action to button states based on action type.
 
         Args:
             action: Discrete action index
 
         Returns:
-            Button array for NES controller
+            Button states for NES controller
 
         Raises:
             ValueError: If action is invalid for the current action type
@@ -663,15 +675,15 @@ class SuperMarioBros2Env(
         if self.action_type == "all":
             if not 0 <= action <= 255:
                 raise ValueError(f"Invalid action {action}. Must be 0-255 for 'all' action type")
-            return action_to_buttons(int(action))
+            return self._action_buttons[int(action)]
         elif self.action_type == "complex":
             if action >= len(COMPLEX_ACTIONS):
                 raise ValueError(f"Invalid action {action}. Must be 0-{len(COMPLEX_ACTIONS)-1}")
-            return actions_to_buttons(COMPLEX_ACTIONS[action])
+            return self._action_buttons[action]
         elif self.action_type == "simple":
             if action >= len(SIMPLE_ACTIONS):
                 raise ValueError(f"Invalid action {action}. Must be 0-{len(SIMPLE_ACTIONS)-1}")
-            return actions_to_buttons(SIMPLE_ACTIONS[action])
+            return self._action_buttons[action]
         else:
             raise ValueError('Action type not supported.')
 
@@ -704,6 +716,7 @@ class SuperMarioBros2Env(
         if not 0 <= slot < MAX_SAVE_SLOTS:
             raise ValueError(f"Slot must be between 0-9, got {slot}")
         self._nes.load_state(slot)
+        self._frame_cache.clear()
 
     def save_state_to_path(self, filepath: str) -> None:
         """Save current emulator state to a file.
@@ -722,6 +735,7 @@ class SuperMarioBros2Env(
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Save state file not found: {filepath}")
         self._nes.load_state_from_path(filepath)
+        self._frame_cache.clear()
 
     def set_frame_speed(self, speed: float) -> None:
         """Set the frame speed for faster/slower emulation.
@@ -5,6 +5,7 @@ from abc import (
     abstractmethod,
 )
 from typing import (
+    Any,
     Optional,
     Protocol,
 )
@@ -29,6 +30,9 @@ class GameStateMixin(ABC):
     _transition_frame_count: int
     _previous_levels_finished: Optional[dict[str, int]]
 
+    # Values derived from the current emulator frame, cleared whenever the emulator advances
+    _frame_cache: dict[str, Any]
+
     @abstractmethod
     def _read_ram_safe(self, address: int) -> int:
         """Read from RAM.
@@ -65,3 +69,7 @@ class HasEnemies(Protocol):
     def enemies(self) -> list[Enemy]:
         """Get all enemy slots with their current runtime data."""
         ...
+
+    def _frame_enemies(self) -> list[Enemy]:
+        """Get this frame's cached enemy slots without copying them."""
+        ...
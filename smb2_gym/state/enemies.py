@@ -1,14 +1,35 @@
 """Enemy-related properties for SMB2 environment."""
 
+from copy import copy
+
 from ..constants import (
+    ENEMY_SLOT_ADDRESSES,
+    ENEMY_SLOT_FIELDS,
     ENEMY_SLOTS,
     PLAYER,
     SCREEN_HEIGHT,
+    SIGNED_BYTE,
     Enemy,
     EnemyState,
 )
 from ._base import GameStateMixin
 
+# Every field of a slot except its state, which is read first to skip empty slots
+_SLOT_DATA_FIELDS = tuple(name for name in ENEMY_SLOT_FIELDS if name != 'state')
+_SLOT_DATA_COLUMNS = [ENEMY_SLOT_FIELDS.index(name) for name in _SLOT_DATA_FIELDS]
+
+# Per slot: (slot number, state address, addresses of _SLOT_DATA_FIELDS)
+_SLOT_READS = tuple(
+    (
+        slot.slot_number,
+        int(addresses[ENEMY_SLOT_FIELDS.index('state')]),
+        tuple(addresses[_SLOT_DATA_COLUMNS].tolist()),
+    ) for slot, addresses in zip(ENEMY_SLOTS, ENEMY_SLOT_ADDRESSES)
+)
+
+# Slot states with no object data worth reading
+_EMPTY_SLOT_STATES = frozenset({int(EnemyState.INVISIBLE), int(EnemyState.DEAD)})
+
 
 class EnemiesMixin(GameStateMixin):
     """Mixin class providing enemy-related properties for SMB2 environment."""
@@ -22,18 +43,34 @@ class EnemiesMixin(GameStateMixin):
     def enemies(self) -> list[Enemy]:
         """Get all 9 enemy slots with their current runtime data.
 
+        Slots are read from RAM once per emulator frame and reused until the next step.
+
         Returns:
             List of 9 Enemy objects (index 0-8 = slots 0-8)
             Invisible/dead slots have None for most fields except state
         """
+        # Enemy is mutable, so hand out copies to keep the frame's slots intact
+        return [copy(enemy) for enemy in self._frame_enemies()]
+
+    def _frame_enemies(self) -> list[Enemy]:
+        """Get this frame's cached enemy slots; callers must not modify them."""
+        enemies_data = self._frame_cache.get('enemies')
+        if enemies_data is None:
+            enemies_data = self._read_enemies()
+            self._frame_cache['enemies'] = enemies_data
+        return enemies_data
+
+    def _read_enemies(self) -> list[Enemy]:
+        """Read all 9 enemy slots from RAM."""
+        read = self._read_ram_safe
         enemies_data = []
-        for slot in ENEMY_SLOTS:
-            state = self._read_ram_safe(slot.state)
+        for slot_number, state_address, field_addresses in _SLOT_READS:
+            state = read(state_address)
 
-            if state in [EnemyState.INVISIBLE, EnemyState.DEAD]:
+            if state in _EMPTY_SLOT_STATES:
                 enemies_data.append(
                     Enemy(
-                        slot_number=slot.slot_number,
+                        slot_number=slot_number,
                         x_position=None,
                         y_position=None,
                         x_page=None,
@@ -50,31 +87,14 @@ class EnemiesMixin(GameStateMixin):
                     )
                 )
             else:
-                # Read Y position and invert it (y=0 at bottom)
-                y_pos_raw = self._read_ram_safe(slot.y_position)
-                y_pos_inverted = SCREEN_HEIGHT - 1 - y_pos_raw
-
-                # Read velocities and convert to signed
-                x_vel_raw = self._read_ram_safe(slot.x_velocity)
-                x_vel_signed = x_vel_raw if x_vel_raw < 128 else x_vel_raw - 256
-                y_vel_raw = self._read_ram_safe(slot.y_velocity)
-                y_vel_signed = y_vel_raw if y_vel_raw < 128 else y_vel_raw - 256
-
-                enemy = Enemy(
-                    slot_number=slot.slot_number,
-                    x_position=self._read_ram_safe(slot.x_position),
-                    y_position=y_pos_inverted,
-                    x_page=self._read_ram_safe(slot.x_page),
-                    y_page=self._read_ram_safe(slot.y_page),
-                    object_type=self._read_ram_safe(slot.object_type),
-                    health=self._read_ram_safe(slot.health),
-                    state=state,
-                    x_velocity=x_vel_signed,
-                    y_velocity=y_vel_signed,
-                    direction=self._read_ram_safe(slot.direction),
-                    collision=self._read_ram_safe(slot.collision),
-                    object_timer=self._read_ram_safe(slot.object_timer),
-                    sprite_flags=self._read_ram_safe(slot.sprite_flags)
-                )
-                enemies_data.append(enemy)
+                slot_data = dict(zip(_SLOT_DATA_FIELDS, map(read, field_addresses)))
+
+                # Invert Y position (y=0 at bottom)
+                slot_data['y_position'] = SCREEN_HEIGHT - 1 - slot_data['y_position']
+
+                # Convert velocities to signed
+                slot_data['x_velocity'] = SIGNED_BYTE[slot_data['x_velocity']]
+                slot_data['y_velocity'] = SIGNED_BYTE[slot_data['y_velocity']]
+
+                enemies_data.append(Enemy(slot_number=slot_number, state=state, **slot_data))
         return enemies_data
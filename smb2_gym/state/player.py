@@ -1,5 +1,7 @@
 """Player state properties for SMB2 environment."""
 
+import warnings
+
 from ..constants import (
     GAME_STATE,
     MAX_CHERRIES,
@@ -8,11 +10,38 @@ from ..constants import (
     MAX_HEARTS,
     MAX_LIVES,
     PLAYER,
+    SIGNED_BYTE,
     TIMERS,
 )
 from ..constants.character_stats import get_character_stats
 from ._base import GameStateMixin
 
+# Life meter byte -> hearts (high nibble + 1), with out-of-range values mapped to the default of 2
+_HEARTS_BY_LIFE_METER = tuple(
+    hearts if 1 <= hearts <= MAX_HEARTS else 2
+    for hearts in (((life_meter & 0xF0) >> 4) + 1 for life_meter in range(256))
+)
+
+# Timer name -> RAM address, for reading every timer in one pass
+_TIMER_ADDRESSES = {
+    'starman': TIMERS.STARMAN,
+    'subspace': TIMERS.SUBSPACE,
+    'stopwatch': TIMERS.STOPWATCH,
+    'invulnerability': TIMERS.INVULNERABILITY,
+    'framerule': TIMERS.FRAMERULE,
+    'pidget_carpet': TIMERS.PIDGET_CARPET,
+    'float': TIMERS.FLOAT,
+    'door_transition': TIMERS.DOOR_TRANSITION,
+}
+
+# Character name -> RAM address of its levels finished counter
+_LEVELS_FINISHED_ADDRESSES = {
+    'mario': PLAYER.LEVELS_FINISHED_MARIO,
+    'peach': PLAYER.LEVELS_FINISHED_PEACH,
+    'toad': PLAYER.LEVELS_FINISHED_TOAD,
+    'luigi': PLAYER.LEVELS_FINISHED_LUIGI,
+}
+
 
 class PlayerStateMixin(GameStateMixin):
     """Mixin class providing player state helper properties for SMB2 environment."""
@@ -36,11 +65,7 @@ class PlayerStateMixin(GameStateMixin):
     @property
     def hearts(self) -> int:
         """Get current hearts (1-4)."""
-        life_meter = self._read_ram_safe(PLAYER.LIFE_METER)
-        hearts = ((life_meter & 0xF0) >> 4) + 1
-        if 1 <= hearts <= MAX_HEARTS:
-            return hearts
-        return 2  # Default
+        return _HEARTS_BY_LIFE_METER[self._read_ram_safe(PLAYER.LIFE_METER)]
 
     @property
     def cherries(self) -> int:
@@ -79,8 +104,7 @@ class PlayerStateMixin(GameStateMixin):
     @property
     def player_speed(self) -> int:
         """Get player horizontal speed (signed: positive=right, negative=left)."""
-        speed = self._read_ram_safe(PLAYER.SPEED)
-        return speed if speed < 128 else speed - 256
+        return SIGNED_BYTE[self._read_ram_safe(PLAYER.SPEED)]
 
     @property
     def on_vine(self) -> bool:
@@ -101,6 +125,8 @@ class PlayerStateMixin(GameStateMixin):
     def level_transition(self) -> int:
         """Get level transition state.
 
+        Deprecated: use `level_completed` or the `levels_finished` counters instead.
+
         NOTE: This value at 0x04EC appears to change for less than a frame.
         The game sets it to non-zero and immediately clears it back to 0
         within the same frame's CPU execution (as seen in disassembly at
@@ -116,6 +142,19 @@ class PlayerStateMixin(GameStateMixin):
         3 - end level, go to bonus game (level completed)
         4 - warp
         """
+        return self._read_level_transition()
+
+    def _read_level_transition(self) -> int:
+        """Read the level transition state, warning that it is deprecated.
+
+        Must be called directly from a public accessor so the warning points at its caller.
+        """
+        warnings.warn(
+            "level_transition is deprecated because it is cleared within the same frame and "
+            "almost always reads 0; use level_completed or levels_finished instead.",
+            DeprecationWarning,
+            stacklevel=3
+        )
         return self._read_ram_safe(GAME_STATE.LEVEL_TRANSITION)
 
     @property
@@ -164,6 +203,11 @@ class PlayerStateMixin(GameStateMixin):
         """Get door transition timer."""
         return self._read_ram_safe(TIMERS.DOOR_TRANSITION)
 
+    @property
+    def timers(self) -> dict[str, int]:
+        """Get all timers at once, keyed by name (e.g. 'starman', 'float')."""
+        return dict(zip(_TIMER_ADDRESSES, map(self._read_ram_safe, _TIMER_ADDRESSES.values())))
+
     @property
     def player_state(self) -> int:
         """Get player state/animation."""
@@ -171,23 +215,33 @@ class PlayerStateMixin(GameStateMixin):
 
     @property
     def levels_finished(self) -> dict[str, int]:
-        """Get levels finished per character."""
-        return {
-            'mario': self._read_ram_safe(PLAYER.LEVELS_FINISHED_MARIO),
-            'peach': self._read_ram_safe(PLAYER.LEVELS_FINISHED_PEACH),
-            'toad': self._read_ram_safe(PLAYER.LEVELS_FINISHED_TOAD),
-            'luigi': self._read_ram_safe(PLAYER.LEVELS_FINISHED_LUIGI),
-        }
+        """Get levels finished per character.
+
+        The counters are read once per emulator frame; each access returns a fresh dict.
+        """
+        return dict(self._read_levels_finished())
+
+    def _read_levels_finished(self) -> dict[str, int]:
+        """Get the shared per-frame levels finished counters (must not be mutated)."""
+        levels_finished = self._frame_cache.get('levels_finished')
+        if levels_finished is None:
+            levels_finished = dict(
+                zip(
+                    _LEVELS_FINISHED_ADDRESSES,
+                    map(self._read_ram_safe, _LEVELS_FINISHED_ADDRESSES.values()),
+                )
+            )
+            self._frame_cache['levels_finished'] = levels_finished
+        return levels_finished
 
     @property
     def level_completed(self) -> bool:
         """Detect if a level was just completed."""
-        if self._previous_levels_finished is None:
+        previous_levels_finished = self._previous_levels_finished
+        if previous_levels_finished is None:
             return False
 
-        current_levels_finished = self.levels_finished
-        for char_name in ['mario', 'peach', 'toad', 'luigi']:
-            if current_levels_finished[char_name] > self._previous_levels_finished.get(char_name, 0):
-                return True
-        return False
-
+        return any(
+            count > previous_levels_finished.get(char_name, 0)
+            for char_name, count in self._read_levels_finished().items()
+        )
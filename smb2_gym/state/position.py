@@ -2,7 +2,7 @@
 
 from ..constants import (
     GAME_STATE,
-    LEVEL_NAMES,
+    LEVEL_NAMES_TUPLE,
     PAGE_SIZE,
     PLAYER,
     SCREEN_HEIGHT,
@@ -10,6 +10,9 @@ from ..constants import (
 )
 from ._base import GameStateMixin
 
+# Raw TOTAL_PAGES_IN_SUB_AREA byte (zero indexed) -> height of a vertical sub-area in pixels
+_VERTICAL_AREA_HEIGHTS = tuple((total_pages + 1) * SCREEN_HEIGHT for total_pages in range(256))
+
 
 class PositionMixin(GameStateMixin):
     """Mixin class providing position, world, and coordinate properties for SMB2 environment."""
@@ -23,7 +26,9 @@ class PositionMixin(GameStateMixin):
     def level(self) -> str:
         """Get current level string (e.g., '1-1', '7-2')."""
         level_id = self._read_ram_safe(GAME_STATE.CURRENT_LEVEL)
-        return LEVEL_NAMES.get(level_id, f"L-{level_id:02X}")
+        if level_id < len(LEVEL_NAMES_TUPLE):
+            return LEVEL_NAMES_TUPLE[level_id]
+        return f"L-{level_id:02X}"
 
     # ---- X ---------------------------------------------------------
 
@@ -85,8 +90,9 @@ class PositionMixin(GameStateMixin):
 
         y_pos_global: int = y_page * SCREEN_HEIGHT + y_pos_raw
 
-        if self.is_vertical_area:
-            max_y_in_level = self.total_pages_in_sub_area * SCREEN_HEIGHT
+        if self._read_ram_safe(GAME_STATE.SCROLL_DIRECTION) == 0x00:  # Vertical area
+            total_pages = self._read_ram_safe(GAME_STATE.TOTAL_PAGES_IN_SUB_AREA)
+            max_y_in_level = _VERTICAL_AREA_HEIGHTS[total_pages]
         else:
             max_y_in_level = SCREEN_HEIGHT
 
@@ -154,39 +160,55 @@ class PositionMixin(GameStateMixin):
         transition before accepting new coordinates to ensure they've fully updated.
 
         Returns:
-            GlobalCoordinate: NamedTuple with area, sub_area, global_x, global_y
+            GlobalCoordinate: Dataclass with area, sub_area, global_x, global_y
         """
-        current_sub_area = self.sub_area
-        current_x = self._x_position_global_raw()
-        current_y = self._y_position_global_raw()
+        # Raw RAM values are read once per frame; the transition tracking below still runs per call
+        raw_coordinates = self._frame_cache.get('raw_global_coordinates')
+        if raw_coordinates is None:
+            raw_coordinates = (
+                self.area,
+                self.sub_area,
+                self._x_position_global_raw(),
+                self._y_position_global_raw(),
+            )
+            self._frame_cache['raw_global_coordinates'] = raw_coordinates
+        area, current_sub_area, current_x, current_y = raw_coordinates
+
+        previous_sub_area = self._previous_sub_area
+        transition_frame_count = self._transition_frame_count
+
+        # Fast path: no transition in progress and the sub-area hasn't changed
+        if transition_frame_count == 0 and current_sub_area == previous_sub_area:
+            return GlobalCoordinate(area, current_sub_area, current_x, current_y)
+
+        previous_x = self._previous_x_global
+        previous_y = self._previous_y_global
 
         # Check if we're in a transition state where sub_area changed but coordinates haven't
-        if (self._previous_sub_area is not None and \
-            self._previous_x_global is not None and
-            self._previous_y_global is not None):
+        if (previous_sub_area is not None and \
+            previous_x is not None and
+            previous_y is not None):
 
             # Detect new transition
-            if (self._transition_frame_count == 0 and \
-                current_sub_area != self._previous_sub_area and \
-                current_x == self._previous_x_global and
-                current_y == self._previous_y_global):
+            if (transition_frame_count == 0 and \
+                current_sub_area != previous_sub_area and \
+                current_x == previous_x and
+                current_y == previous_y):
                 self._transition_frame_count = 1
-                current_sub_area = self._previous_sub_area
+                current_sub_area = previous_sub_area
 
             # Detect transition period
-            elif self._transition_frame_count > 0:
-                self._transition_frame_count += 1
-                if self._transition_frame_count <= self.AREA_TRANSITION_FRAMES:
-                    current_sub_area = self._previous_sub_area
-                    current_x = self._previous_x_global
-                    current_y = self._previous_y_global
-                elif self._transition_frame_count == self.AREA_TRANSITION_FRAMES + 1:
-                    self._transition_frame_count = 0  # Reset counter
-
-        return GlobalCoordinate(
-            area=self.area,
-            sub_area=current_sub_area,
-            global_x=current_x,
-            global_y=current_y,
-        )
+            elif transition_frame_count > 0:
+                transition_frame_count += 1
+                transition_frames = self.AREA_TRANSITION_FRAMES
+                if transition_frame_count <= transition_frames:
+                    current_sub_area = previous_sub_area
+                    current_x = previous_x
+                    current_y = previous_y
+                elif transition_frame_count == transition_frames + 1:
+                    transition_frame_count = 0  # Reset counter
+                self._transition_frame_count = transition_frame_count
+
+        # Positional construction (area, sub_area, global_x, global_y) skips keyword matching
+        return GlobalCoordinate(area, current_sub_area, current_x, current_y)
 
@@ -1,7 +1,11 @@
 """Semantic tile map for SMB2 environment."""
 
 import warnings
-from typing import Any
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+)
 
 import numpy as np
 from numpy.typing import NDArray
@@ -25,6 +29,7 @@ from ..constants.semantic import (
     COLOR_LOOKUP,
     SEMANTIC_TILE_DTYPE,
     TILE_ID_MAPPING,
+    TILE_TYPE_LOOKUP,
     FineTileType,
 )
 from ._base import (
@@ -32,6 +37,83 @@ from ._base import (
     HasEnemies,
 )
 
+# Tile IDs that have an entry in TILE_ID_MAPPING
+_KNOWN_TILE_LOOKUP = np.zeros(256, dtype=bool)
+_KNOWN_TILE_LOOKUP[[int(tile_id) for tile_id in TILE_ID_MAPPING]] = True
+
+# Level data in SRAM is stored as 16x15 tile pages
+_BYTES_PER_PAGE = LEVEL_PAGE_WIDTH * LEVEL_PAGE_HEIGHT
+_MAX_SRAM_SIZE = 0x960  # 2400 bytes
+
+# Subspace keeps the current screen as a row-major tile grid in RAM
+_SUBSPACE_RAM_START = 0x0700
+_SUBSPACE_RAM_ADDRESSES = _SUBSPACE_RAM_START + np.arange(
+    SCREEN_TILES_HEIGHT * SCREEN_TILES_WIDTH
+).reshape(SCREEN_TILES_HEIGHT, SCREEN_TILES_WIDTH)
+
+# Screen tile offsets, shaped to broadcast to a (height, width) grid
+_SCREEN_TILES_SHAPE = (SCREEN_TILES_HEIGHT, SCREEN_TILES_WIDTH)
+_VIEWPORT_HEIGHT_PIXELS = SCREEN_TILES_HEIGHT * TILE_SIZE
+
+# RAM registers that make up the viewport offset, in unpacking order
+_VIEWPORT_ADDRESSES = (
+    VIEWPORT.SCREEN_BOUNDARY_LEFT_HI,
+    VIEWPORT.SCREEN_BOUNDARY_LEFT_LO,
+    VIEWPORT.SCREEN_Y_HI,
+    VIEWPORT.SCREEN_Y_LO,
+    VIEWPORT.PPU_SCROLL_X_MIRROR,
+    GAME_STATE.SCROLL_DIRECTION,
+)
+_TILE_ROWS = np.arange(SCREEN_TILES_HEIGHT)[:, np.newaxis]
+_TILE_COLUMNS = np.arange(SCREEN_TILES_WIDTH)[np.newaxis, :]
+
+
+@lru_cache(maxsize=256)
+def _viewport_sram_layout(
+    viewport_x: int,
+    viewport_y: int,
+    scroll_direction: int,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Get the SRAM page and address of every on-screen tile.
+
+    The layout only depends on the viewport, so it is cached and returned read-only.
+
+    Args:
+        viewport_x: Viewport X offset in tiles
+        viewport_y: Viewport Y offset in tiles
+        scroll_direction: Level scroll direction (0x00 uses Y pages, otherwise X pages)
+
+    Returns:
+        tuple of (page_numbers, sram_addresses) - both 15x16 arrays (height x width)
+    """
+    # World position of each tile in the viewport
+    world_x = viewport_x + _TILE_COLUMNS
+    world_y = viewport_y + _TILE_ROWS
+
+    # Calculate which page each tile belongs to
+    # NOTE: scroll_direction may be inverted from what's documented?
+    if scroll_direction == 0x00:
+        # Use Y page (vertical scrolling)
+        page_numbers = np.broadcast_to(world_y // LEVEL_PAGE_HEIGHT, _SCREEN_TILES_SHAPE)
+    else:
+        # Use X page (horizontal scrolling)
+        page_numbers = np.broadcast_to(world_x // LEVEL_PAGE_WIDTH, _SCREEN_TILES_SHAPE)
+
+    # Each page is 16x15 = 240 bytes (LEVEL_PAGE_WIDTH * LEVEL_PAGE_HEIGHT)
+    tile_x_in_page = world_x % LEVEL_PAGE_WIDTH
+    tile_y_in_page = world_y % LEVEL_PAGE_HEIGHT
+    tile_index_in_page = tile_y_in_page * LEVEL_PAGE_WIDTH + tile_x_in_page
+    sram_addresses = (page_numbers * _BYTES_PER_PAGE + tile_index_in_page) % _MAX_SRAM_SIZE
+    sram_addresses.flags.writeable = False
+
+    return page_numbers, sram_addresses
+
+
+def _read_bytes(read: Callable[[int], int], addresses: NDArray[np.int64]) -> NDArray[np.uint8]:
+    """Read one byte per address with a per-byte reader, keeping the address grid's shape."""
+    values = map(read, addresses.ravel().tolist())
+    return np.fromiter(values, dtype=np.uint8, count=addresses.size).reshape(addresses.shape)
+
 
 class SemanticMapMixin(GameStateMixin, HasEnemies):
     """Mixin providing semantic tile map for SMB2 environment.
@@ -130,10 +212,11 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
             return []
 
         # Get sprite bounds
-        min_x = min(sprite[3] for sprite in oam_sprites)
-        max_x = max(sprite[3] for sprite in oam_sprites)
-        min_y = min(sprite[0] for sprite in oam_sprites)
-        max_y = max(sprite[0] for sprite in oam_sprites)
+        sprite_ys, _tile_ids, _attributes, sprite_xs = zip(*oam_sprites)
+        min_x = min(sprite_xs)
+        max_x = max(sprite_xs)
+        min_y = min(sprite_ys)
+        max_y = max(sprite_ys)
 
         # Calculate which tiles are occupied
         tiles: list[tuple[int, int]] = []
@@ -147,8 +230,8 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
         num_hearts = (life_meter >> 4) + 1
         is_big = num_hearts >= 2
 
-        # Check if ducking
-        is_ducking = self.is_player_ducking()
+        # Check if ducking (only big players can duck, so skip the OAM reads otherwise)
+        is_ducking = is_big and self.is_player_ducking()
 
         if is_big and not is_ducking:
             # Big player standing: occupies 2 vertical tiles
@@ -184,31 +267,29 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
         viewport_y_pixels = viewport_y * TILE_SIZE
 
         enemy_positions: list[tuple[int, int, int]] = []
-        for enemy in self.enemies:
+        for enemy in self._frame_enemies():
             if enemy.state != EnemyState.VISIBLE:
                 continue
 
-            if enemy.x_page is None or enemy.x_position is None:
-                continue
-            if enemy.y_page is None or enemy.y_position is None:
-                continue
-            if enemy.object_type is None:
+            # Visible slots always carry full data (see _read_enemies); this narrows the types
+            if (
+                enemy.x_page is None or enemy.x_position is None or enemy.y_page is None
+                or enemy.y_position is None or enemy.object_type is None
+            ):
                 continue
 
             # Calculate world position in pixels
-            # NOTE: y_position is already inverted (y=0 at bottom), but we need raw Y here
-            # We need to un-invert it for screen coordinates
+            # NOTE: y_position is already inverted (y=0 at bottom), so un-invert it back to
+            # raw Y (top-down) for screen rendering
             world_x = (enemy.x_page * PAGE_SIZE) + enemy.x_position
-            # Convert back to raw Y (top-down) for screen rendering
-            world_y_raw = (SCREEN_HEIGHT - 1) - enemy.y_position
-            world_y = (enemy.y_page * PAGE_SIZE) + world_y_raw
+            world_y = (enemy.y_page * PAGE_SIZE) + (SCREEN_HEIGHT - 1) - enemy.y_position
 
             # Convert to screen coordinates
             screen_x = world_x - viewport_x_pixels
             screen_y = world_y - viewport_y_pixels
 
             # Only include enemies that are on screen
-            if 0 <= screen_x < PAGE_SIZE and 0 <= screen_y < SCREEN_TILES_HEIGHT * TILE_SIZE:
+            if 0 <= screen_x < PAGE_SIZE and 0 <= screen_y < _VIEWPORT_HEIGHT_PIXELS:
                 enemy_positions.append((screen_x, screen_y, enemy.object_type))
 
         return enemy_positions
@@ -254,21 +335,28 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
         smooth sub-page scrolling. For vertical scrolling, ScreenYHi/Lo already
         includes the fine offset.
 
+        The offset is computed once per emulator frame and reused until the next step.
+
         Returns:
             tuple of (viewport_x_offset, viewport_y_offset) in tiles
         """
-        # Read the camera base position
-        viewport_x_hi = self._read_ram_safe(VIEWPORT.SCREEN_BOUNDARY_LEFT_HI)
-        viewport_x_lo = self._read_ram_safe(VIEWPORT.SCREEN_BOUNDARY_LEFT_LO)
-        viewport_y_hi = self._read_ram_safe(VIEWPORT.SCREEN_Y_HI)
-        viewport_y_lo = self._read_ram_safe(VIEWPORT.SCREEN_Y_LO)
-
-        # Read PPU scroll positions for fine scrolling
-        scroll_x = self._read_ram_safe(VIEWPORT.PPU_SCROLL_X_MIRROR)
-        scroll_y = self._read_ram_safe(VIEWPORT.PPU_SCROLL_Y_MIRROR)
-
-        # Check scroll direction to determine scrolling type
-        scroll_direction = self._read_ram_safe(GAME_STATE.SCROLL_DIRECTION)
+        viewport_offset = self._frame_cache.get('viewport_offset')
+        if viewport_offset is None:
+            viewport_offset = self._read_viewport_offset()
+            self._frame_cache['viewport_offset'] = viewport_offset
+        return viewport_offset
+
+    def _read_viewport_offset(self) -> tuple[int, int]:
+        """Read the viewport offset in tiles from the camera and scroll registers."""
+        # Read the camera base position, PPU fine scroll and scroll direction in one pass
+        (
+            viewport_x_hi,
+            viewport_x_lo,
+            viewport_y_hi,
+            viewport_y_lo,
+            scroll_x,
+            scroll_direction,
+        ) = map(self._read_ram_safe, _VIEWPORT_ADDRESSES)
 
         # Combine boundary and scroll positions
         # For horizontal scrolling levels (scroll_direction != 0x00):
@@ -302,10 +390,6 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
         Returns:
             tuple of (tile_id_map, tile_type_map) - both 15x16 uint8 arrays
         """
-        # Initialize maps (height x width)
-        tile_id_map = np.zeros((SCREEN_TILES_HEIGHT, SCREEN_TILES_WIDTH), dtype=np.uint8)
-        tile_type_map = np.zeros((SCREEN_TILES_HEIGHT, SCREEN_TILES_WIDTH), dtype=np.uint8)
-
         # Check if in subspace (subspace_status == 2 means in subspace)
         subspace_status = self._read_ram_safe(GAME_STATE.SUBSPACE_STATUS)
         in_subspace = (subspace_status == 2)
@@ -314,25 +398,17 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
             # Subspace: read from dedicated subspace RAM region
             # 0x0700 - 0x07FF (256 bytes) contains the subspace tile layout
             # When entering subspace, the current screen is stored here (possibly reversed)
-            SUBSPACE_RAM_START = 0x0700
-            for y in range(SCREEN_TILES_HEIGHT):
-                for x in range(SCREEN_TILES_WIDTH):
-                    ram_address = SUBSPACE_RAM_START + (y * SCREEN_TILES_WIDTH + x)
-                    tile_id = self._read_ram_safe(ram_address)
-                    tile_id_map[y, x] = tile_id
-
-                    # Map tile ID to type
-                    if tile_id not in TILE_ID_MAPPING:
-                        warnings.warn(
-                            f"Unknown tile ID {tile_id} at subspace position ({x}, {y}), "
-                            f"RAM address 0x{ram_address:04X}. Treating as EMPTY tile.",
-                            RuntimeWarning,
-                            stacklevel=3
-                        )
-                        tile_type_map[y, x] = FineTileType.EMPTY
-                    else:
-                        tile_type_map[y, x] = TILE_ID_MAPPING[tile_id]
-            return tile_id_map, tile_type_map
+            tile_id_map = _read_bytes(self._read_ram_safe, _SUBSPACE_RAM_ADDRESSES)
+
+            # Unknown tile IDs map to EMPTY in the lookup table
+            for y, x in zip(*np.nonzero(~_KNOWN_TILE_LOOKUP[tile_id_map])):
+                warnings.warn(
+                    f"Unknown tile ID {tile_id_map[y, x]} at subspace position ({x}, {y}), "
+                    f"RAM address 0x{_SUBSPACE_RAM_ADDRESSES[y, x]:04X}. Treating as EMPTY tile.",
+                    RuntimeWarning,
+                    stacklevel=4
+                )
+            return tile_id_map, TILE_TYPE_LOOKUP[tile_id_map]
 
         # Normal gameplay: read from standard SRAM
         # Get viewport offset
@@ -341,56 +417,25 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
         # Check scroll direction (0x00=horizontal, 0x01=vertical)
         scroll_direction = self._read_ram_safe(GAME_STATE.SCROLL_DIRECTION)
 
-        # SRAM contains level data
-        MAX_SRAM_SIZE = 0x960  # 2400 bytes
-
         # Read tile data using read_sram (one byte at a time)
-        for y in range(SCREEN_TILES_HEIGHT):
-            for x in range(SCREEN_TILES_WIDTH):
-                # Calculate the world position of this tile in the viewport
-                world_x = viewport_x + x
-                world_y = viewport_y + y
-
-                # Convert world position back to SRAM address
-                page_x = world_x // LEVEL_PAGE_WIDTH
-                page_y = world_y // LEVEL_PAGE_HEIGHT
-                tile_x_in_page = world_x % LEVEL_PAGE_WIDTH
-                tile_y_in_page = world_y % LEVEL_PAGE_HEIGHT
-
-                # Calculate which page this tile belongs to
-                # NOTE: scroll_direction may be inverted from what's documented?
-                if scroll_direction == 0x00:
-                    # Use Y page (vertical scrolling)
-                    page_number = page_y
-                else:
-                    # Use X page (horizontal scrolling)
-                    page_number = page_x
-
-                # Calculate SRAM address
-                # Each page is 16x15 = 240 bytes (LEVEL_PAGE_WIDTH * LEVEL_PAGE_HEIGHT)
-                BYTES_PER_PAGE = LEVEL_PAGE_WIDTH * LEVEL_PAGE_HEIGHT
-                tile_index_in_page = tile_y_in_page * LEVEL_PAGE_WIDTH + tile_x_in_page
-                sram_address = (page_number * BYTES_PER_PAGE + tile_index_in_page) % MAX_SRAM_SIZE
-
-                # Read the tile ID from SRAM
-                tile_id = self._nes.read_sram(sram_address)
-                tile_id_map[y, x] = tile_id
-
-                # Map tile ID to tile type with fallback for unknown tiles
-                if tile_id not in TILE_ID_MAPPING:
-                    warnings.warn(
-                        f"Unknown tile ID {tile_id} at screen position ({x}, {y}), "
-                        f"world position ({world_x}, {world_y}), "
-                        f"SRAM address 0x{sram_address:04X}, "
-                        f"page {page_number}. Treating as EMPTY tile.",
-                        RuntimeWarning,
-                        stacklevel=3
-                    )
-                    tile_type_map[y, x] = FineTileType.EMPTY
-                else:
-                    tile_type_map[y, x] = TILE_ID_MAPPING[tile_id]
-
-        return tile_id_map, tile_type_map
+        page_numbers, sram_addresses = _viewport_sram_layout(
+            viewport_x, viewport_y, scroll_direction
+        )
+        tile_id_map = _read_bytes(self._nes.read_sram, sram_addresses)
+
+        # Unknown tile IDs map to EMPTY in the lookup table
+        for y, x in zip(*np.nonzero(~_KNOWN_TILE_LOOKUP[tile_id_map])):
+            warnings.warn(
+                f"Unknown tile ID {tile_id_map[y, x]} at screen position ({x}, {y}), "
+                f"world position ({viewport_x + x}, {viewport_y + y}), "
+                f"SRAM address 0x{sram_addresses[y, x]:04X}, "
+                f"page {page_numbers[y, x]}. Treating as EMPTY tile.",
+                RuntimeWarning,
+                stacklevel=4
+            )
+
+        # Map every tile ID to its type in one gather
+        return tile_id_map, TILE_TYPE_LOOKUP[tile_id_map]
 
     @property
     def semantic_map(self) -> NDArray[Any]:
@@ -402,9 +447,19 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
         - coarse_type: Coarse-grained CoarseTileType (TERRAIN, ENEMY, etc.)
         - color_r, color_g, color_b: RGB visualisation colour
 
+        The map is built once per emulator frame; each access returns a fresh copy.
+
         Returns:
             2D structured numpy array (15 x 16) with SEMANTIC_TILE_DTYPE (height x width).
         """
+        semantic_map = self._frame_cache.get('semantic_map')
+        if semantic_map is None:
+            semantic_map = self._read_semantic_map()
+            self._frame_cache['semantic_map'] = semantic_map
+        return semantic_map.copy()
+
+    def _read_semantic_map(self) -> NDArray[Any]:
+        """Build the semantic map from SRAM tiles and RAM enemy slots."""
         # Read tile maps from SRAM
         tile_id_map, fine_type_map = self._read_tile_maps()
 
@@ -420,8 +475,9 @@ class SemanticMapMixin(GameStateMixin, HasEnemies):
         semantic_map['tile_id'] = tile_id_map
         semantic_map['fine_type'] = fine_type_map
         semantic_map['coarse_type'] = COARSE_LOOKUP[fine_type_map]
-        semantic_map['color_r'] = COLOR_LOOKUP[fine_type_map, 0]
-        semantic_map['color_g'] = COLOR_LOOKUP[fine_type_map, 1]
-        semantic_map['color_b'] = COLOR_LOOKUP[fine_type_map, 2]
+        colors = COLOR_LOOKUP[fine_type_map]
+        semantic_map['color_r'] = colors[..., 0]
+        semantic_map['color_g'] = colors[..., 1]
+        semantic_map['color_b'] = colors[..., 2]
 
         return semantic_map
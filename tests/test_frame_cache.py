@@ -0,0 +1,66 @@
+"""Test that per-frame derived state is invalidated when the emulator changes."""
+
+import numpy as np
+
+
+def _fill_frame_cache(env):
+    """Cache every per-frame property, plus a marker that only a cache clear removes."""
+    env.enemies
+    env.semantic_map
+    env.levels_finished
+    env._frame_cache['stale'] = True
+
+
+def _assert_frame_cache_cleared(env):
+    """Verify the marker is gone and cached properties match a fresh RAM read."""
+    assert 'stale' not in env._frame_cache
+    assert env.enemies == env._read_enemies()
+    assert env.levels_finished == env._read_levels_finished()
+    np.testing.assert_array_equal(env.semantic_map, env._read_semantic_map())
+
+
+def test_frame_cache_cleared_on_step_and_reset(env_no_render):
+    """Verify step and reset drop values cached for the previous frame."""
+    env_no_render.reset()
+
+    for _ in range(30):
+        _fill_frame_cache(env_no_render)
+        env_no_render.step(1)
+        _assert_frame_cache_cleared(env_no_render)
+
+    _fill_frame_cache(env_no_render)
+    env_no_render.reset()
+    _assert_frame_cache_cleared(env_no_render)
+
+
+def test_frame_cache_cleared_on_load_state(env_no_render, tmp_path, monkeypatch):
+    """Verify loading a save state from a slot or a path drops cached values."""
+    monkeypatch.chdir(tmp_path)  # Slot saves are written to the working directory
+    env_no_render.reset()
+    state_path = str(tmp_path / "state.sav")
+    env_no_render.save_state(0)
+    env_no_render.save_state_to_path(state_path)
+
+    for _ in range(30):
+        env_no_render.step(1)
+
+    _fill_frame_cache(env_no_render)
+    env_no_render.load_state(0)
+    _assert_frame_cache_cleared(env_no_render)
+
+    for _ in range(30):
+        env_no_render.step(1)
+
+    _fill_frame_cache(env_no_render)
+    env_no_render.load_state_from_path(state_path)
+    _assert_frame_cache_cleared(env_no_render)
+
+
+def test_enemies_are_copies(env_no_render):
+    """Verify editing a returned enemy leaves the frame's cached slots untouched."""
+    env_no_render.reset()
+    enemy = env_no_render.enemies[0]
+    enemy.state = -1
+    enemy.x_position = -1
+
+    assert env_no_render.enemies == env_no_render._read_enemies()
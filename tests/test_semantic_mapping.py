@@ -3,7 +3,11 @@
 import pytest
 
 from smb2_gym.constants.object_ids import BackgroundTile
-from smb2_gym.constants.semantic import TILE_ID_MAPPING
+from smb2_gym.constants.semantic import (
+    TILE_ID_MAPPING,
+    TILE_TYPE_LOOKUP,
+    FineTileType,
+)
 
 
 def test_all_background_tiles_are_mapped():
@@ -76,3 +80,27 @@ def test_all_tile_ids_are_valid_background_tiles():
             + "\n\nAll tile IDs must be valid BackgroundTile enum values."
         )
         pytest.fail(error_msg)
+
+
+def test_tile_type_lookup_matches_mapping():
+    """Verify that TILE_TYPE_LOOKUP agrees with TILE_ID_MAPPING for every tile ID.
+
+    The semantic map reads tile types through this table, so every mapped ID must
+    gather its FineTileType and any unmapped ID must fall back to EMPTY.
+    """
+    assert TILE_TYPE_LOOKUP.shape == (256,)
+
+    mismatches = []
+    for tile_id in range(256):
+        expected = TILE_ID_MAPPING.get(tile_id, FineTileType.EMPTY)
+        if TILE_TYPE_LOOKUP[tile_id] != expected:
+            mismatches.append(
+                f"  0x{tile_id:02X} ({tile_id:3d}): lookup {TILE_TYPE_LOOKUP[tile_id]}, "
+                f"expected {expected!r}"
+            )
+
+    if mismatches:
+        pytest.fail(
+            f"\n{len(mismatches)} TILE_TYPE_LOOKUP entries disagree with TILE_ID_MAPPING:\n"
+            + "\n".join(mismatches)
+        )